@@ -1,10 +1,34 @@
 import argparse
+import glob
+import hashlib
 import os
 import pandas as pd
+import pickle
+import re
 import requests
 import sys
-import wget
-import json
+import threading
+import xlsxwriter
+import ijson
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib.util import find_spec
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+print_lock = threading.Lock()
+
+
+def split_list(value: str):
+    """
+    The function `split_list` splits a comma-separated string (e.g. "APT16, FIN7") into a list of items,
+    stripping the whitespace around each item and dropping empty items, so that an input such as "APT16,"
+    does not produce an empty keyword matching every group.
+
+    :param value: The `value` parameter is a string of items separated by commas
+    :type value: str
+    :return: a list of non-empty strings.
+    """
+    return [item for item in re.split(r'\s*,\s*', value.strip()) if item]
 
 
 def parse_arguments():
@@ -30,6 +54,10 @@ def parse_arguments():
                                (with -k/--keywords), the script will not search for groups in
                                'APT Groups and Operations.xlsx'.
 
+    -c/--cache/--no-cache: A boolean argument. Defaults to True. When --no-cache is specified, the script neither
+                           reads nor writes the parsed data of 'enterprise-attack.json' and
+                           'APT Groups and Operations.xlsx' cached in the '.cache' directory.
+
     -u/--update: A boolean argument. Defaults to False. When this argument is specified, the script performs an
                  update (downloads) of 'enterprise-attack.json' and 'APT Groups and Operations.xlsx'.
 
@@ -44,15 +72,17 @@ def parse_arguments():
         python get_apt_groups_ttp.py -k "financial" --no-tracker
     - To search for groups in 'APT Groups and Operations.xlsx' only:
         python get_apt_groups_ttp.py -k "financial" --no-mitre
+    - To search without using the cache:
+        python get_apt_groups_ttp.py -k "financial" --no-cache
     - To update files without searching:
         python get_apt_groups_ttp.py -u
     """
     parser = argparse.ArgumentParser(description='Script for analyzing and retrieving information about APT groups '
                                                  'and their TTPs (json from MITRE).')
-    parser.add_argument('-g', '--groups', type=lambda x: [str.strip(i) for i in x.split(',')],
+    parser.add_argument('-g', '--groups', type=split_list,
                         help='Specify APT group names to download JSON files (from MITRE) containing their TTPs. Can '
                              'be a single or multiple groups separated by commas (example: -g "APT16, FIN7").')
-    parser.add_argument('-k', '--keywords', type=lambda x: [str.strip(i) for i in x.split(',')],
+    parser.add_argument('-k', '--keywords', type=split_list,
                         help="Specify keywords to search for APT groups in 'enterprise-attack.json' and 'APT Groups "
                              "and Operations.xlsx'. Can be a single or multiple keywords separated by commas "
                              "(example: -k 'financial, China').")
@@ -62,11 +92,17 @@ def parse_arguments():
     parser.add_argument('-t', '--tracker', action=argparse.BooleanOptionalAction, default=True,
                         help="If set to False (--no-tracker) with -k/--keywords, do not search in "
                              "'APT Groups and Operations.xlsx' (example: -k 'financial' --no-tracker)")
+    parser.add_argument('-c', '--cache', action=argparse.BooleanOptionalAction, default=True,
+                        help="If set to False (--no-cache), do not read or write the parsed data of "
+                             "'enterprise-attack.json' and 'APT Groups and Operations.xlsx' cached in the '.cache' "
+                             "directory (example: -k 'financial' --no-cache)")
     parser.add_argument('-u', '--update', action='store_true', default=False,
                         help="If set, update (download) 'enterprise-attack.json' and 'APT Groups and Operations.xlsx'.")
     arguments = parser.parse_args()
     if len(sys.argv) > 1:
-        if not arguments.groups and not arguments.keywords and not arguments.update:
+        if arguments.keywords == []:
+            parser.error('argument -k/--keywords: no keywords to search for')
+        elif not arguments.groups and not arguments.keywords and not arguments.update:
             parser.error('one of the arguments -g/--groups -k/--keywords -u/--update is required ')
         elif arguments.groups and arguments.keywords:
             parser.error('argument -k/--keywords: not allowed with argument -g/--groups')
@@ -91,9 +127,21 @@ def print_menu():
         print(f"{light_blue}[{key}]{end_color} {value}")
 
 
-def bar_progress(current, total, width=80):
+def print_line(message):
+    """
+    The function `print_line` prints a message as a whole line while holding `print_lock`, so that lines
+    written by downloads running at the same time do not interleave.
+
+    :param message: The message to print
+    """
+    with print_lock:
+        sys.stdout.write(f"{message}\n")
+        sys.stdout.flush()
+
+
+def bar_progress(current, total, width=80, label='Progress'):
     """
-    The function `bar_progress` displays the progress of a task as a percentage.
+    The function `bar_progress` displays the progress of a task as a percentage, on a line of its own.
     
     :param current: The current progress value. It represents the current progress of a task or
     operation
@@ -101,16 +149,100 @@ def bar_progress(current, total, width=80):
     you are tracking the progress of
     :param width: The `width` parameter is an optional parameter that specifies the width of the
     progress bar. By default, it is set to 80 characters, defaults to 80 (optional)
+    :param label: The `label` parameter is a string printed before the percentage, so that the progress of
+    downloads running at the same time can be told apart, defaults to 'Progress' (optional)
+    """
+    print_line("%s: %d%%" % (label, current / total * 100))
+
+
+def download_file(url: str, filename: str, attempts: int = 5):
+    """
+    The function `download_file` streams a file from a URL to disk. The data is written to a temporary
+    '<filename>.part' file which replaces `filename` only once the download is complete. If the connection
+    drops, or a '.part' file is left over from a previous run, the download is resumed with an HTTP Range
+    request instead of starting over. The request carries the ETag of the partial data in an If-Range header,
+    so the server sends the whole file again if it has changed since; a '.part' file without a strong ETag is
+    never resumed. Transfers are requested without compression so that byte offsets match the data on disk.
+    The ETag of the downloaded file is kept in the '.cache' directory; if `filename` already exists and a HEAD
+    request returns the same ETag, the download is skipped. Progress is printed in steps of 10%.
+
+    :param url: The `url` parameter is a string that represents the URL of the file to download
+    :type url: str
+    :param filename: The `filename` parameter is a string that represents the name of the file where the
+    downloaded data will be saved
+    :type filename: str
+    :param attempts: The `attempts` parameter is the number of attempts made when the connection drops in
+    the middle of the transfer before giving up, defaults to 5 (optional)
+    :type attempts: int
+    :return: False if the file is already up to date, True if it has been downloaded.
     """
-    progress_message = "Progress: %d%%" % (current / total * 100)
-    sys.stdout.write("\r" + progress_message)
-    sys.stdout.flush()
+    part_filename = f"{filename}.part"
+    etag_filename = os.path.join('.cache', f"{os.path.basename(filename)}.etag")
+    part_etag_filename = os.path.join('.cache', f"{os.path.basename(part_filename)}.etag")
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(max_retries=Retry(total=5, backoff_factor=0.5)))
+    session.headers['Accept-Encoding'] = 'identity'
+    os.makedirs('.cache', exist_ok=True)
+    with session:
+        if os.path.isfile(filename) and os.path.isfile(etag_filename):
+            etag = session.head(url, allow_redirects=True, timeout=30).headers.get('ETag')
+            with open(etag_filename, encoding='utf-8') as f:
+                if etag and etag == f.read():
+                    return False
+        etag = None
+        attempt = 1
+        while True:
+            part_etag = None
+            if os.path.isfile(part_etag_filename):
+                with open(part_etag_filename, encoding='utf-8') as f:
+                    part_etag = f.read()
+            if os.path.exists(part_filename) and not part_etag:
+                os.remove(part_filename)
+            current = start = os.path.getsize(part_filename) if os.path.exists(part_filename) else 0
+            headers = {'Range': f'bytes={current}-', 'If-Range': part_etag} if current else {}
+            try:
+                with session.get(url, headers=headers, stream=True, timeout=30) as response:
+                    if response.status_code == 416 and current:
+                        os.remove(part_filename)
+                        continue
+                    response.raise_for_status()
+                    etag = response.headers.get('ETag')
+                    if response.status_code != 206:
+                        current = 0
+                        if etag and not etag.startswith('W/'):
+                            with open(part_etag_filename, 'w', encoding='utf-8') as f:
+                                f.write(etag)
+                        elif os.path.exists(part_etag_filename):
+                            os.remove(part_etag_filename)
+                    total = current + int(response.headers.get('Content-Length', 0))
+                    step = None
+                    with open(part_filename, 'ab' if current else 'wb', buffering=8 * 1024 * 1024) as file:
+                        for chunk in response.iter_content(chunk_size=1024 * 1024):
+                            file.write(chunk)
+                            current += len(chunk)
+                            if total and current * 10 // total != step:
+                                step = current * 10 // total
+                                bar_progress(current, total, label=os.path.basename(filename))
+                break
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                if attempt >= attempts or current == start:
+                    raise
+                attempt += 1
+    os.replace(part_filename, filename)
+    if os.path.exists(part_etag_filename):
+        os.remove(part_etag_filename)
+    if etag:
+        with open(etag_filename, 'w', encoding='utf-8') as f:
+            f.write(etag)
+    elif os.path.exists(etag_filename):
+        os.remove(etag_filename)
+    return True
 
 
 def update_apt_groups(apt_filename: str):
     """
     The function `update_apt_groups` downloads a file from a Google Drive URL and saves it with the
-    specified filename, removing any existing file with the same name.
+    specified filename, replacing any existing file with the same name unless it is already up to date.
     
     :param apt_filename: The `apt_filename` parameter is a string that represents the name of the file
     that will be downloaded from Google Drive
@@ -119,20 +251,20 @@ def update_apt_groups(apt_filename: str):
     """
     try:
         url = 'https://docs.google.com/spreadsheets/d/1H9_xaxQHpWaa4O_Son4Gx0YOIzlcBWMsdvePFX68EKU/pub?output=xlsx'
-        if os.path.exists(apt_filename):
-            os.remove(apt_filename)
-        print(f"Downloading '{apt_filename}' file from Google Drive:")
-        wget.download(url, apt_filename, bar=bar_progress)
-        print()
+        print_line(f"Downloading '{apt_filename}' file from Google Drive...")
+        if download_file(url, apt_filename):
+            print_line(f"'{apt_filename}' has been downloaded.")
+        else:
+            print_line(f"'{apt_filename}' is already up to date.")
         return
     except Exception as e:
-        print(e)
+        print_line(e)
 
 
 def update_matrix(matrix_filename: str):
     """
     The function `update_matrix` downloads a file from a specified URL and saves it with a given
-    filename, removing any existing file with the same name.
+    filename, replacing any existing file with the same name unless it is already up to date.
     
     :param matrix_filename: The `matrix_filename` parameter is a string that represents the name of the
     file where the matrix will be saved
@@ -141,51 +273,83 @@ def update_matrix(matrix_filename: str):
     """
     try:
         url = 'https://raw.githubusercontent.com/mitre/cti/master/enterprise-attack/enterprise-attack.json'
-        if os.path.exists(matrix_filename):
-            os.remove(matrix_filename)
-        print(f"Downloading '{matrix_filename}' file from MITRE GitHub:")
-        wget.download(url, matrix_filename, bar=bar_progress)
-        print()
+        print_line(f"Downloading '{matrix_filename}' file from MITRE GitHub...")
+        if download_file(url, matrix_filename):
+            print_line(f"'{matrix_filename}' has been downloaded.")
+        else:
+            print_line(f"'{matrix_filename}' is already up to date.")
         return
     except Exception as e:
-        print(e)
+        print_line(e)
 
 
-def search_groups_from_mitre(groups: list, keywords: list):
+def join_keywords(keywords: list):
+    """
+    The function `join_keywords` joins a list of keywords into a single regular expression, so that a text is
+    scanned once no matter how many keywords are searched for. Case sensitivity is left to the caller, e.g.
+    `str.contains(..., case=False)`, or lowercased keywords matched against lowercased text.
+
+    :param keywords: A list of keywords to search for. Keywords are escaped, so they are matched literally
+    :type keywords: list
+    :return: a regular expression string matching any of the keywords.
+    """
+    return '|'.join(re.escape(word) for word in keywords)
+
+
+def write_dataframe(worksheet, df: pd.DataFrame, header_format=None):
+    """
+    The function `write_dataframe` writes a DataFrame to an xlsxwriter worksheet row by row, starting with
+    a header row. Rows are written in order, as required by workbooks opened in `constant_memory` mode,
+    where each row is flushed to disk as soon as the next one is started.
+
+    :param worksheet: The `worksheet` parameter is the xlsxwriter worksheet the data will be written to
+    :param df: The `df` parameter is the DataFrame to write. The index is not written
+    :type df: pd.DataFrame
+    :param header_format: The `header_format` parameter is an optional xlsxwriter format applied to the
+    header row, defaults to None (optional)
+    :return: nothing.
+    """
+    worksheet.write_row(0, 0, df.columns, header_format)
+    for row, values in enumerate(df.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row, 0, values)
+
+
+def search_groups_from_mitre(groups: pd.DataFrame, keywords: list):
     """
     The function `search_groups_from_mitre` searches for APT groups in an JSON file (enterprise-attack.json)
     based on keywords in the description field and exports the results to an Excel file.
     
-    :param groups: The `groups` parameter is a list of dictionaries, where each dictionary represents an
-    APT group. Each dictionary should have the following keys: 'name', 'aliases', and 'description'
-    :type groups: list
+    :param groups: The `groups` parameter is a DataFrame of APT groups returned by `get_all_groups_from_mitre`,
+    with the 'name', 'aliases', 'description' and 'description_lower' columns
+    :type groups: pd.DataFrame
     :param keywords: A list of keywords to search for in the Description field of the APT groups
     :type keywords: list
     :return: The function does not return any value.
     """
     try:
+        if not keywords:
+            print('[MITRE]: No keywords to search for.')
+            return
         print('[MITRE]: Searching by keyword(s) in the Description field...')
-        result = []
-        for word in keywords:
-            filtered_groups = list(filter(lambda x: word.lower() in x['description'].lower(), groups))
-            if filtered_groups:
-                result.extend(filtered_groups)
-        if result:
-            df = pd.DataFrame(result)[['name', 'aliases', 'description']]
+        pattern = join_keywords([word.lower() for word in keywords])
+        mask = groups['description_lower'].str.contains(pattern, regex=True, na=False)
+        df = groups.loc[mask, ['name', 'aliases', 'description']].copy()
+        if not df.empty:
             df['aliases'] = df['aliases'].str.join(', ')
-            df.sort_values(by='name')
-            with pd.ExcelWriter('APT Groups list from MITRE.xlsx', engine='xlsxwriter') as file:
-                df.to_excel(file, sheet_name='APT Groups', index=False)
-                workbook = file.book
+            df.sort_values(by='name', inplace=True, kind='stable')
+            options = {'constant_memory': True, 'strings_to_urls': False}
+            with xlsxwriter.Workbook('APT Groups list from MITRE.xlsx', options) as workbook:
                 format_border = workbook.add_format({'border': 1})
                 format_wrap = workbook.add_format({'valign': 'top', 'text_wrap': True})
-                worksheet = file.sheets['APT Groups']
+                format_header = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+                worksheet = workbook.add_worksheet('APT Groups')
                 worksheet.autofilter(f"A1:C{str(df.shape[0])}")
                 worksheet.conditional_format(f"A1:C{str(df.shape[0] + 1)}",
                                              {'type': 'no_blanks', 'format': format_border})
                 worksheet.set_column('A:A', 15, format_wrap)
                 worksheet.set_column('B:B', 80, format_wrap)
                 worksheet.set_column('C:C', 150, format_wrap)
+                write_dataframe(worksheet, df, format_header)
             print('[MITRE]: Found!')
         else:
             print('[MITRE]: APT Groups not found.')
@@ -194,7 +358,41 @@ def search_groups_from_mitre(groups: list, keywords: list):
         print(e)
 
 
-def search_groups_from_tracker(filename: str, keywords: list):
+def get_all_groups_from_tracker(filename: str, use_cache: bool = True):
+    """
+    The function `get_all_groups_from_tracker` reads the "Common Name", "Toolset / Malware", "Targets" and
+    "Comment" columns of the APT group sheets of an Excel file (APT Groups and Operations.xlsx) into a
+    single DataFrame. The result is cached as a parquet file in the '.cache' directory, keyed by the hash of
+    the Excel file.
+
+    :param filename: The filename parameter is a string that represents the name or path of the Excel
+    file that contains the data to be read
+    :type filename: str
+    :param use_cache: The `use_cache` parameter is a boolean that specifies whether the cache is read and
+    written, defaults to True (optional)
+    :type use_cache: bool
+    :return: a DataFrame of APT groups with pyarrow-backed string columns.
+    """
+    cache_filename = get_cache_filename(filename, 'tracker', 'parquet') if use_cache else None
+    if cache_filename and os.path.isfile(cache_filename):
+        try:
+            return pd.read_parquet(cache_filename, engine='pyarrow')
+        except Exception as e:
+            print(e)
+    columns = ['Common Name', 'Toolset / Malware', 'Targets', 'Comment']
+    engine = 'calamine' if find_spec('python_calamine') else 'openpyxl'
+    with pd.ExcelFile(filename, engine=engine) as workbook:
+        sheets = workbook.parse(sheet_name=workbook.sheet_names[1:10], skiprows=1,
+                                usecols=lambda column: column in columns)
+    data = pd.concat([df_sheet[columns] for df_sheet in sheets.values()],
+                     ignore_index=True).astype('string[pyarrow]')
+    if cache_filename:
+        prepare_cache(cache_filename)
+        data.to_parquet(cache_filename, engine='pyarrow', index=False)
+    return data
+
+
+def search_groups_from_tracker(filename: str, keywords: list, use_cache: bool = True):
     """
     The function `search_groups_from_tracker` searches for APT groups in an Excel file (APT Groups and Operations.xlsx)
     based on keywords in "Targets" and "Comment" fields and saves the results in a new Excel file.
@@ -206,36 +404,35 @@ def search_groups_from_tracker(filename: str, keywords: list):
     to search for in the "Targets" and "Comment" fields of the APT Tracker data. These keywords will be
     used to filter the data and find the relevant APT groups
     :type keywords: list
+    :param use_cache: The `use_cache` parameter is a boolean that specifies whether the parsed Excel file is
+    read from and written to the cache, defaults to True (optional)
+    :type use_cache: bool
     :return: The function does not return any value.
     """
     try:
+        if not keywords:
+            print('[APT Tracker]: No keywords to search for.')
+            return
         print('[APT Tracker]: Searching by keyword(s) in "Targets" and "Comment" fields...')
-        df_name = pd.ExcelFile(filename)
-        result = pd.DataFrame()
-        for sheet in df_name.sheet_names[1:10]:
-            df_sheet = pd.read_excel(filename, sheet_name=sheet, skiprows=1)
-            data = df_sheet[['Common Name', 'Toolset / Malware', 'Targets', 'Comment']]
-            df_search = pd.DataFrame()
-            for word in keywords:
-                df_search = pd.concat(
-                    [df_search,
-                     data[data['Targets'].str.contains(word, case=False) | data['Comment'].str.contains(word,
-                                                                                                        case=False)]])
-            result = pd.concat([result, df_search])
+        data = get_all_groups_from_tracker(filename, use_cache)
+        pattern = join_keywords(keywords)
+        result = data[data['Targets'].str.contains(pattern, case=False, na=False) |
+                      data['Comment'].str.contains(pattern, case=False, na=False)]
         if not result.empty:
-            result = result.sort_values(by='Common Name')
+            result = result.sort_values(by='Common Name', kind='stable', ignore_index=True)
             result = result.fillna('-')
-            with pd.ExcelWriter('APT Groups list from APT Tracker.xlsx', engine='xlsxwriter') as file:
-                result.to_excel(file, sheet_name='APT Groups', index=False)
-                workbook = file.book
+            options = {'constant_memory': True, 'strings_to_urls': False}
+            with xlsxwriter.Workbook('APT Groups list from APT Tracker.xlsx', options) as workbook:
                 format_border = workbook.add_format({'border': 1})
                 format_wrap = workbook.add_format({'valign': 'top', 'text_wrap': True})
-                worksheet = file.sheets['APT Groups']
+                format_header = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+                worksheet = workbook.add_worksheet('APT Groups')
                 worksheet.autofilter(f"A1:D{str(result.shape[0])}")
                 worksheet.conditional_format(f"A1:D{str(result.shape[0] + 1)}",
                                              {'type': 'no_blanks', 'format': format_border})
                 worksheet.set_column('A:A', 40, format_wrap)
                 worksheet.set_column('B:D', 70, format_wrap)
+                write_dataframe(worksheet, result, format_header)
             print('[APT Tracker]: Found!')
         else:
             print('[APT Tracker]: APT Groups not found.')
@@ -244,15 +441,35 @@ def search_groups_from_tracker(filename: str, keywords: list):
         print(e)
 
 
-def get_groups_ttps_from_mitre(groups: list, apt_aliases: list):
+def download_group_json(session: requests.Session, url: str, path: str):
+    """
+    The function `download_group_json` downloads a single JSON file (MITRE ATT&CK Navigator layer) and
+    streams it to disk in chunks.
+
+    :param session: The `session` parameter is a `requests.Session` shared between the downloads so that
+    connections to the MITRE ATT&CK website are reused
+    :type session: requests.Session
+    :param url: The `url` parameter is a string that represents the URL of the JSON file
+    :type url: str
+    :param path: The `path` parameter is a string that represents the path where the JSON file will be saved
+    :type path: str
+    :return: nothing.
+    """
+    with session.get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        with open(path, 'wb') as file:
+            for chunk in response.iter_content(chunk_size=65536):
+                file.write(chunk)
+
+
+def get_groups_ttps_from_mitre(groups: pd.DataFrame, apt_aliases: list):
     """
-    The function `get_groups_ttps_from_mitre` searches for APT groups in a given list and downloads JSON
+    The function `get_groups_ttps_from_mitre` searches for APT groups in a given DataFrame and downloads JSON
     files containing information about the groups from the MITRE ATT&CK website.
     
-    :param groups: The `groups` parameter is a list of dictionaries that represent APT groups. Each
-    dictionary contains information about an APT group, such as its name, aliases, and external
-    references
-    :type groups: list
+    :param groups: The `groups` parameter is a DataFrame of APT groups returned by `get_all_groups_from_mitre`.
+    Each row contains information about an APT group, such as its name, aliases, and external references
+    :type groups: pd.DataFrame
     :param apt_aliases: The `apt_aliases` parameter is a list of strings representing the aliases or
     names of APT (Advanced Persistent Threat) groups. These aliases are used to search for corresponding
     APT groups in the `groups` list
@@ -260,42 +477,130 @@ def get_groups_ttps_from_mitre(groups: list, apt_aliases: list):
     :return: The function does not explicitly return anything.
     """
     try:
+        alias_index = {}
+        for position, aliases in enumerate(groups['aliases']):
+            for alias in aliases:
+                alias_index.setdefault(alias.lower(), position)
+        downloads = {}
         for apt_alias in apt_aliases:
             print(f"[MITRE]: Searching APT group '{apt_alias}'...")
-            apt_group = list(filter(lambda x: apt_alias.lower() in [str.lower(i) for i in x['aliases']], groups))
-            if apt_group:
-                group_link = apt_group[0]['external_references'][0]['url']
-                group_id = apt_group[0]['external_references'][0]['external_id']
+            position = alias_index.get(apt_alias.lower())
+            if position is not None:
+                group_link = groups['external_references'].iat[position][0]['url']
+                group_id = groups['external_references'].iat[position][0]['external_id']
                 json_name = f"{group_id}-enterprise-layer.json"
-                url = f"{group_link}/{json_name}"
-                req = requests.get(url)
-                with open(f'jsons/{json_name}', 'wb') as file:
-                    file.write(req.content)
-                print('[MITRE]: Found! JSON files have been downloaded to the ./jsons/ directory.')
+                downloads[f"{group_link}/{json_name}"] = json_name
             else:
                 print(f"[MITRE]: Group '{apt_alias}' not found")
+        if not downloads:
+            return
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        with session, ThreadPoolExecutor(max_workers=min(16, len(downloads))) as executor:
+            futures = {executor.submit(download_group_json, session, url, f'jsons/{json_name}'): json_name
+                       for url, json_name in downloads.items()}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    print(f"[MITRE]: Found! '{futures[future]}' has been downloaded to the ./jsons/ directory.")
+                except Exception as e:
+                    print(e)
         return
     except Exception as e:
         print(e)
 
 
-def get_all_groups_from_mitre(filename: str):
+def get_cache_filename(filename: str, prefix: str, extension: str):
+    """
+    The function `get_cache_filename` returns the name of the file in the '.cache' directory in which the
+    data parsed from a source file is cached. The name contains the BLAKE2 hash of the source file, so a
+    changed source file never matches an old cache file.
+
+    :param filename: The `filename` parameter is a string that represents the name or path of the source file
+    :type filename: str
+    :param prefix: The `prefix` parameter is a string that identifies the kind of cached data, e.g. 'groups'
+    :type prefix: str
+    :param extension: The `extension` parameter is the extension of the cache file, e.g. 'pkl'
+    :type extension: str
+    :return: the name of the cache file, e.g. '.cache/groups-<hash>.pkl'.
+    """
+    file_hash = hashlib.blake2b(digest_size=16)
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            file_hash.update(chunk)
+    return os.path.join('.cache', f"{prefix}-{file_hash.hexdigest()}.{extension}")
+
+
+def prepare_cache(cache_filename: str):
+    """
+    The function `prepare_cache` creates the '.cache' directory if needed and removes the cache files left
+    by previous versions of the same source file.
+
+    :param cache_filename: The `cache_filename` parameter is a string returned by `get_cache_filename`
+    :type cache_filename: str
+    :return: nothing.
+    """
+    directory, name = os.path.split(cache_filename)
+    os.makedirs(directory, exist_ok=True)
+    prefix, extension = name.rsplit('-', 1)[0], os.path.splitext(name)[1]
+    for stale_filename in glob.glob(os.path.join(directory, f"{prefix}-*{extension}")):
+        if stale_filename != cache_filename:
+            os.remove(stale_filename)
+
+
+def groups_to_dataframe(groups: list):
+    """
+    The function `groups_to_dataframe` converts a list of APT groups (intrusion-set objects) into a DataFrame
+    with one row per group, so that searches run as vectorized column operations.
+
+    :param groups: The `groups` parameter is a list of dictionaries, where each dictionary represents an
+    APT group
+    :type groups: list
+    :return: a DataFrame with the 'name', 'aliases', 'description', 'external_references' and
+    'description_lower' (lowercased description, pyarrow-backed) columns.
+    """
+    df = pd.DataFrame({
+        'name': [group.get('name', '') for group in groups],
+        'aliases': [group.get('aliases', []) for group in groups],
+        'description': [group.get('description', '') for group in groups],
+        'external_references': [group.get('external_references', []) for group in groups],
+    })
+    df['description_lower'] = df['description'].astype('string[pyarrow]').str.lower()
+    return df
+
+
+def get_all_groups_from_mitre(filename: str, use_cache: bool = True):
     """
-    The function `get_all_groups_from_mitre` reads a JSON file (enterprise-attack.json), filters out intrusion-set objects that
-    are deprecated or revoked, and returns a list of the remaining groups.
+    The function `get_all_groups_from_mitre` streams a JSON file (enterprise-attack.json) object by object,
+    filters out intrusion-set objects that are deprecated or revoked, and returns the remaining groups.
+    The groups are cached as a pickle file in the '.cache' directory, keyed by the hash of the JSON file.
     
     :param filename: The `filename` parameter is a string that represents the name or path of the file
     from which the data will be read
     :type filename: str
-    :return: a list of groups that meet certain criteria.
+    :param use_cache: The `use_cache` parameter is a boolean that specifies whether the cache is read and
+    written, defaults to True (optional)
+    :type use_cache: bool
+    :return: a DataFrame of groups that meet certain criteria (see `groups_to_dataframe`).
     """
     try:
-        with open(filename, encoding='utf-8') as f:
-            data = json.load(f)
-        groups = list(filter(lambda x: x['type'] == 'intrusion-set' and not (
-                ("x_mitre_deprecated" in x and x["x_mitre_deprecated"]) or ("revoked" in x and x["revoked"])),
-                             data['objects']))
-        return groups
+        cache_filename = get_cache_filename(filename, 'groups', 'pkl') if use_cache else None
+        if cache_filename and os.path.isfile(cache_filename):
+            try:
+                with open(cache_filename, 'rb') as f:
+                    return groups_to_dataframe(pickle.load(f))
+            except Exception as e:
+                print(e)
+        with open(filename, 'rb') as f:
+            groups = [x for x in ijson.items(f, 'objects.item', use_float=True)
+                      if x.get('type') == 'intrusion-set' and not x.get('x_mitre_deprecated') and not x.get('revoked')]
+        if cache_filename:
+            prepare_cache(cache_filename)
+            with open(cache_filename, 'wb') as f:
+                pickle.dump(groups, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return groups_to_dataframe(groups)
     except Exception as e:
         print(e)
 
@@ -317,9 +622,10 @@ def main(arguments):
             'tracker': ('APT Groups and Operations.xlsx', update_apt_groups),
             'mitre': ('enterprise-attack.json', update_matrix)
         }
-        for key in files:
-            if not os.path.isfile(files[key][0]) or arguments.update:
-                files[key][1](files[key][0])
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            for filename, update in files.values():
+                if not os.path.isfile(filename) or arguments.update:
+                    executor.submit(update, filename)
         if len(sys.argv) == 1:
             choice = ''
             while choice not in (1, 2, 3, 4, 5, 0):
@@ -328,17 +634,17 @@ def main(arguments):
                     choice = int(input('\nEnter your choice: '))
                 except:
                     print('Wrong input. Please enter a number ...')
-            if choice in (1, 2, 3):
-                groups = get_all_groups_from_mitre(files['mitre'][0])
+            if choice in (1, 3):
+                groups = get_all_groups_from_mitre(files['mitre'][0], arguments.cache)
                 if choice == 1:
-                    keywords = input('Enter keywords to search: ').split(',')
-                    search_groups_from_mitre(groups, [str.strip(i) for i in keywords])
-                elif choice == 2:
-                    keywords = input('Enter keywords to search: ').split(',')
-                    search_groups_from_tracker(files['tracker'][0], [str.strip(i) for i in keywords])
+                    keywords = split_list(input('Enter keywords to search: '))
+                    search_groups_from_mitre(groups, keywords)
                 elif choice == 3:
-                    apt_groups = input('Enter APT groups: ').split(',')
-                    get_groups_ttps_from_mitre(groups, [str.strip(i) for i in apt_groups])
+                    apt_groups = split_list(input('Enter APT groups: '))
+                    get_groups_ttps_from_mitre(groups, apt_groups)
+            elif choice == 2:
+                keywords = split_list(input('Enter keywords to search: '))
+                search_groups_from_tracker(files['tracker'][0], keywords, arguments.cache)
             elif choice == 4:
                 update_apt_groups(files['tracker'][0])
             elif choice == 5:
@@ -348,14 +654,13 @@ def main(arguments):
             else:
                 print('Wrong input. Please enter a number ...')
         else:
-            groups = get_all_groups_from_mitre(files['mitre'][0])
             if args.keywords:
                 if args.mitre:
-                    search_groups_from_mitre(groups, args.keywords)
+                    search_groups_from_mitre(get_all_groups_from_mitre(files['mitre'][0], args.cache), args.keywords)
                 if args.tracker:
-                    search_groups_from_tracker(files['tracker'][0], args.keywords)
+                    search_groups_from_tracker(files['tracker'][0], args.keywords, args.cache)
             elif args.groups:
-                get_groups_ttps_from_mitre(groups, args.groups)
+                get_groups_ttps_from_mitre(get_all_groups_from_mitre(files['mitre'][0], args.cache), args.groups)
         return 'Bye!'
     except Exception as e:
         print(e)